@@ -1,5 +1,5 @@
 import { Command, InvalidArgumentError } from 'commander';
-import { runReviewBenchmark } from '../lib/review-benchmark.js';
+import type { runReviewBenchmark } from '../lib/review-benchmark.js';
 
 const collect = (value: string, values: string[]): string[] => [...values, value];
 const positive = (value: string): number => {
@@ -8,7 +8,13 @@ const positive = (value: string): number => {
   return n;
 };
 
-export function createBenchmarkCommand(run = runReviewBenchmark): Command {
+// The benchmark runner pulls in the review runtime, so load it only when the command runs.
+const runReviewBenchmarkLazily: typeof runReviewBenchmark = async (options) => {
+  const { runReviewBenchmark } = await import('../lib/review-benchmark.js');
+  return runReviewBenchmark(options);
+};
+
+export function createBenchmarkCommand(run = runReviewBenchmarkLazily): Command {
   const command = new Command('benchmark').description('Run opt-in DRS calibration benchmarks');
   command
     .command('review')
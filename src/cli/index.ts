@@ -5,13 +5,9 @@ import chalk from 'chalk';
 import { readFileSync } from 'fs';
 import { fileURLToPath } from 'url';
 import { dirname, join } from 'path';
-import { runAgent } from './run-agent.js';
-import { listWorkflows, showWorkflow, showWorkflowGraph, validateWorkflows } from './workflow.js';
 import type { WorkflowExecutor } from '../lib/workflow/executor.js';
 import { loadConfig } from '../lib/config.js';
 import { configureLogger, type LogFormat } from '../lib/logger.js';
-import { runTemporalWorker } from '../temporal/worker.js';
-import { createWorkflowExecutor } from './workflow-executor-selection.js';
 import { config as loadDotenv } from 'dotenv';
 import { getProjectSetupStatus } from '../lib/project-setup.js';
 import { createWikiCommand } from './wiki.js';
@@ -100,6 +96,7 @@ program
         timestamps: options.logFormat === 'json',
       });
 
+      const { runAgent } = await import('./run-agent.js');
       const config = loadConfig(process.cwd());
       const thinkingLevel = options.ultrathink ? 'high' : options.reasoningEffort;
 
@@ -155,6 +152,7 @@ workflowCommand
         throw new Error('Provide a workflow name or set workflow.default in .drs/drs.config.yaml.');
       }
 
+      const { createWorkflowExecutor } = await import('./workflow-executor-selection.js');
       const executor: WorkflowExecutor = createWorkflowExecutor(
         String(options.executor ?? 'local'),
         options.wait !== false
@@ -181,8 +179,9 @@ workflowCommand
   .command('list')
   .description('List available workflows (packaged and project-defined)')
   .option('--json', 'Output as JSON')
-  .action((options) => {
+  .action(async (options) => {
     try {
+      const { listWorkflows } = await import('./workflow.js');
       const config = loadConfig(process.cwd());
       listWorkflows(config, {
         json: options.json ?? false,
@@ -200,8 +199,9 @@ workflowCommand
   .alias('get')
   .description('Show workflow details, including inputs and nodes')
   .option('--json', 'Output as JSON')
-  .action((name: string, options) => {
+  .action(async (name: string, options) => {
     try {
+      const { showWorkflow } = await import('./workflow.js');
       const config = loadConfig(process.cwd());
       showWorkflow(config, name, {
         json: options.json ?? false,
@@ -218,12 +218,13 @@ workflowCommand
   .command('graph <name>')
   .description('Show workflow graph edges as text, JSON, or Mermaid')
   .option('--format <format>', 'Output format: text, json, or mermaid', 'text')
-  .action((name: string, options) => {
+  .action(async (name: string, options) => {
     try {
       const format = String(options.format ?? 'text');
       if (!['text', 'json', 'mermaid'].includes(format)) {
         throw new Error('Invalid graph format. Expected one of: text, json, mermaid.');
       }
+      const { showWorkflowGraph } = await import('./workflow.js');
       const config = loadConfig(process.cwd());
       showWorkflowGraph(config, name, {
         format: format as 'text' | 'json' | 'mermaid',
@@ -240,8 +241,9 @@ workflowCommand
   .command('validate [name]')
   .description('Validate workflow definitions without running them')
   .option('--json', 'Output as JSON')
-  .action((name: string | undefined, options) => {
+  .action(async (name: string | undefined, options) => {
     try {
+      const { validateWorkflows } = await import('./workflow.js');
       const config = loadConfig(process.cwd());
       const results = validateWorkflows(config, name, {
         json: options.json ?? false,
@@ -271,6 +273,7 @@ temporalCommand
         format: (options.logFormat as LogFormat) ?? 'human',
         timestamps: options.logFormat === 'json',
       });
+      const { runTemporalWorker } = await import('../temporal/worker.js');
       const config = loadConfig(process.cwd());
       await runTemporalWorker(config);
     } catch (error) {
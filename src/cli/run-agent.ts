@@ -46,12 +46,12 @@ export interface RunAgentOptions {
 async function readStdin(): Promise<string> {
   process.stdin.setEncoding('utf-8');
 
-  let input = '';
+  const chunks: string[] = [];
   for await (const chunk of process.stdin) {
-    input += chunk;
+    chunks.push(chunk as string);
   }
 
-  return input;
+  return chunks.join('');
 }
 
 async function readPrompt(options: RunAgentOptions, workingDir: string): Promise<string> {
@@ -154,7 +154,6 @@ export async function runAgent(
 
   let session: Session | undefined;
   let usage = createAgentUsageSummary(agentId);
-  let response = '';
   let result: AgentRunResult | undefined;
   let operationError: Error | undefined;
   let cleanupError: Error | undefined;
@@ -171,10 +170,11 @@ export async function runAgent(
       message: prompt,
     });
 
+    const responseParts: string[] = [];
     for await (const message of runtimeClient.streamMessages(session.id)) {
       if (message.role === 'assistant') {
         usage = applyUsageMessage(usage, message);
-        response += message.content;
+        responseParts.push(message.content);
         continue;
       }
 
@@ -183,6 +183,7 @@ export async function runAgent(
       }
     }
 
+    const response = responseParts.join('');
     usage = {
       ...usage,
       success: true,
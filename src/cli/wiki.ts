@@ -1,6 +1,6 @@
 import chalk from 'chalk';
 import { Command, InvalidArgumentError } from 'commander';
-import { buildWikiSite, serveWikiSite, type WikiSiteOptions } from '../lib/wiki-site.js';
+import type { WikiSiteOptions } from '../lib/wiki-site.js';
 import { waitForWikiSite } from '../lib/wiki-site-smoke.js';
 import { searchWiki, type WikiSearchResult } from '../lib/wiki-search.js';
 
@@ -41,6 +41,8 @@ export function createWikiCommand(): Command {
     .option('--json', 'Output the build result as JSON')
     .action(async (options) => {
       try {
+        // VitePress is only needed to build or serve, so keep it off the CLI startup path.
+        const { buildWikiSite } = await import('../lib/wiki-site.js');
         const result = await buildWikiSite({
           ...toSiteOptions(options),
           quiet: options.json === true,
@@ -66,6 +68,7 @@ export function createWikiCommand(): Command {
     .option('--port <port>', 'TCP port', parsePositiveInteger, 4173)
     .action(async (options) => {
       try {
+        const { serveWikiSite } = await import('../lib/wiki-site.js');
         const server = await serveWikiSite({
           ...toSiteOptions(options),
           host: options.host,
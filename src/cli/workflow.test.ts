@@ -403,6 +403,7 @@ describe('workflow runner', () => {
 
   afterEach(() => {
     vi.restoreAllMocks();
+    vi.unstubAllEnvs();
     for (const dir of tempDirs.splice(0, tempDirs.length)) {
       rmSync(dir, { recursive: true, force: true });
     }
@@ -958,6 +959,51 @@ describe('workflow runner', () => {
     expect(result.artifacts.stagedPaths).toEqual(['CHANGELOG.md', 'README.md']);
   });
 
+  it('checks the git repository once for git nodes sharing a working directory', async () => {
+    const projectRoot = createTempDir('drs-workflow-git-repo-check-');
+    const config = {
+      ...baseConfig,
+      workflows: {
+        stageDiff: {
+          nodes: {
+            diff: { action: 'git-diff', output: 'localDiff' },
+            stage: { action: 'git-add', needs: ['diff'], with: { paths: 'README.md' } },
+          },
+        },
+      },
+    } as unknown as DRSConfig;
+
+    await runWorkflow(config, 'stageDiff', { workingDir: projectRoot });
+
+    expect(mocks.git.checkIsRepo).toHaveBeenCalledTimes(1);
+    expect(mocks.git.add).toHaveBeenCalledWith(['README.md']);
+  });
+
+  it('re-checks the git repository after a negative answer', async () => {
+    const projectRoot = createTempDir('drs-workflow-git-repo-recheck-');
+    mocks.git.checkIsRepo.mockResolvedValueOnce(false);
+    const config = {
+      ...baseConfig,
+      workflows: {
+        diffs: {
+          nodes: {
+            first: { action: 'git-diff', output: 'firstDiff' },
+            second: { action: 'git-diff', output: 'secondDiff' },
+          },
+        },
+      },
+    } as unknown as DRSConfig;
+
+    // Independent action nodes share the workspace lock, so the second node runs after the
+    // first has failed on the negative answer.
+    await expect(runWorkflow(config, 'diffs', { workingDir: projectRoot })).rejects.toThrow(
+      'Workflow git-diff node "first" must run from a git repository.'
+    );
+
+    expect(mocks.git.checkIsRepo).toHaveBeenCalledTimes(2);
+    expect(mocks.git.diff).toHaveBeenCalledTimes(1);
+  });
+
   it('commits only configured paths with a git-commit action', async () => {
     const projectRoot = createTempDir('drs-workflow-git-commit-');
     const config = {
@@ -4369,6 +4415,153 @@ describe('workflow runner', () => {
     ).rejects.toThrow(/unstable merge request head/);
   });
 
+  describe('with DRS_CACHE_DIR', () => {
+    const cachedPullRequest = {
+      number: 8,
+      title: 'GitLab MR',
+      author: 'gitlab-user',
+      sourceBranch: 'feature',
+      targetBranch: 'main',
+      headSha: 'abc123',
+      baseSha: 'base123',
+      platformData: { changes_count: '1' },
+    };
+    const changeConfig = (requireCompleteDiff: boolean) =>
+      ({
+        ...baseConfig,
+        workflows: {
+          change: {
+            nodes: {
+              change: {
+                action: 'change-source',
+                with: { type: 'gitlab-mr', project: 'group/repo', mr: 8, requireCompleteDiff },
+                output: 'change',
+              },
+            },
+          },
+        },
+      }) as unknown as DRSConfig;
+
+    beforeEach(() => {
+      vi.stubEnv('DRS_CACHE_DIR', createTempDir('drs-workflow-change-cache-'));
+      mocks.gitlabAdapter.getPullRequest.mockResolvedValue(cachedPullRequest);
+    });
+
+    it('serves a repeated GitLab change source from the cache, even when incomplete', async () => {
+      mocks.gitlabAdapter.getChangedFilesSnapshot.mockResolvedValue({
+        files: [
+          {
+            filename: 'assets/logo.png',
+            status: 'modified',
+            additions: 0,
+            deletions: 0,
+            patch: 'Binary files a/assets/logo.png and b/assets/logo.png differ',
+          },
+        ],
+        complete: false,
+        incompleteFiles: ['assets/logo.png'],
+        headSha: 'abc123',
+      });
+
+      const first = await runWorkflow(changeConfig(false), 'change', {
+        workingDir: process.cwd(),
+      });
+      const second = await runWorkflow(changeConfig(false), 'change', {
+        workingDir: process.cwd(),
+      });
+
+      expect(mocks.gitlabAdapter.getChangedFilesSnapshot).toHaveBeenCalledTimes(1);
+      expect(mocks.gitlabAdapter.getChangedFiles).not.toHaveBeenCalled();
+      expect(first.artifacts.change).toMatchObject({ files: ['assets/logo.png'] });
+      expect(second.artifacts.change).toMatchObject({ files: ['assets/logo.png'] });
+    });
+
+    it('does not cache a GitLab snapshot computed for a different head', async () => {
+      mocks.gitlabAdapter.getChangedFilesSnapshot.mockResolvedValue({
+        files: [
+          {
+            filename: 'src/gitlab.ts',
+            status: 'modified',
+            additions: 3,
+            deletions: 1,
+            patch: '@@ +1 @@\n+gitlab',
+          },
+        ],
+        complete: true,
+        incompleteFiles: [],
+        headSha: 'pushed-during-fetch',
+      });
+
+      await runWorkflow(changeConfig(false), 'change', { workingDir: process.cwd() });
+      await runWorkflow(changeConfig(false), 'change', { workingDir: process.cwd() });
+
+      expect(mocks.gitlabAdapter.getChangedFilesSnapshot).toHaveBeenCalledTimes(2);
+    });
+
+    const gitlabFile = (filename: string) => ({
+      filename,
+      status: 'modified',
+      additions: 1,
+      deletions: 0,
+      patch: '@@ +1 @@\n+gitlab',
+    });
+    const completeSnapshot = (...filenames: string[]) => ({
+      files: filenames.map(gitlabFile),
+      complete: true,
+      incompleteFiles: [],
+      headSha: 'abc123',
+    });
+
+    it('refetches a cached snapshot that does not match changes_count', async () => {
+      mocks.gitlabAdapter.getChangedFilesSnapshot.mockResolvedValue(
+        completeSnapshot('src/gitlab.ts')
+      );
+      await runWorkflow(changeConfig(true), 'change', { workingDir: process.cwd() });
+
+      mocks.gitlabAdapter.getPullRequest.mockResolvedValue({
+        ...cachedPullRequest,
+        platformData: { changes_count: '2' },
+      });
+      mocks.gitlabAdapter.getChangedFilesSnapshot.mockResolvedValue(
+        completeSnapshot('src/gitlab.ts', 'src/other.ts')
+      );
+
+      const result = await runWorkflow(changeConfig(true), 'change', {
+        workingDir: process.cwd(),
+      });
+
+      expect(mocks.gitlabAdapter.getChangedFilesSnapshot).toHaveBeenCalledTimes(2);
+      expect(result.artifacts.change).toMatchObject({
+        files: ['src/gitlab.ts', 'src/other.ts'],
+      });
+    });
+
+    it('does not cache a snapshot that fails the changes_count check', async () => {
+      mocks.gitlabAdapter.getPullRequest.mockResolvedValue({
+        ...cachedPullRequest,
+        platformData: { changes_count: '2' },
+      });
+      mocks.gitlabAdapter.getChangedFilesSnapshot.mockResolvedValueOnce(
+        completeSnapshot('src/gitlab.ts')
+      );
+
+      await expect(
+        runWorkflow(changeConfig(true), 'change', { workingDir: process.cwd() })
+      ).rejects.toThrow(/complete GitLab file list/);
+
+      mocks.gitlabAdapter.getChangedFilesSnapshot.mockResolvedValue(
+        completeSnapshot('src/gitlab.ts', 'src/other.ts')
+      );
+      const retry = await runWorkflow(changeConfig(true), 'change', {
+        workingDir: process.cwd(),
+      });
+      await runWorkflow(changeConfig(true), 'change', { workingDir: process.cwd() });
+
+      expect(retry.artifacts.change).toMatchObject({ files: ['src/gitlab.ts', 'src/other.ts'] });
+      expect(mocks.gitlabAdapter.getChangedFilesSnapshot).toHaveBeenCalledTimes(2);
+    });
+  });
+
   it('does not publish a packaged GitLab review after the MR head changes', async () => {
     const projectRoot = createTempDir('drs-workflow-stale-gitlab-review-');
     mocks.gitlabAdapter.getPullRequest
@@ -28,6 +28,7 @@ import {
   type ReviewSource,
 } from '../lib/review-orchestrator.js';
 import type {
+  ChangedFilesSnapshot,
   FileChange,
   InlineCommentPosition,
   LineValidator,
@@ -54,7 +55,17 @@ import {
   validateHtmlArtifact,
 } from '../lib/html-artifact.js';
 import { getCanonicalDiffCommand, resolveBaseBranch } from '../lib/repository-validator.js';
-import { formatCodeQualityReport, generateCodeQualityReport } from '../lib/code-quality-report.js';
+import {
+  formatCodeQualityReportChunks,
+  generateCodeQualityReport,
+} from '../lib/code-quality-report.js';
+import {
+  getChangeSourceCacheDir,
+  readCachedChangedFilesSnapshot,
+  removeCachedChangedFilesSnapshot,
+  writeCachedChangedFilesSnapshot,
+  type ChangeSourceCacheKey,
+} from '../lib/change-source-cache.js';
 import {
   formatOkfValidationErrors,
   synchronizeOkfIndexes,
@@ -165,6 +176,7 @@ export {
 
 interface WorkflowExecutionContext {
   gitClients: Map<string, ReturnType<typeof simpleGit>>;
+  gitRepoChecks: Map<string, Promise<boolean>>;
   platformClients: Partial<Record<WorkflowPlatform, PlatformClient>>;
   traceCollector?: TraceCollector;
   locks: {
@@ -258,6 +270,36 @@ function getWorkflowGitClient(
   return git;
 }
 
+/**
+ * Check once per working directory whether it is a git repository, so each
+ * git node does not spawn its own `git rev-parse` before the real command.
+ * Only a positive answer is kept: an earlier node, such as an agent with shell
+ * access, may initialize the repository, so negative or failed checks are retried.
+ */
+function isWorkflowGitRepo(
+  executionContext: WorkflowExecutionContext,
+  workingDir: string
+): Promise<boolean> {
+  const existing = executionContext.gitRepoChecks.get(workingDir);
+  if (existing) {
+    return existing;
+  }
+
+  const check = getWorkflowGitClient(executionContext, workingDir).checkIsRepo();
+  executionContext.gitRepoChecks.set(workingDir, check);
+  const forget = () => {
+    if (executionContext.gitRepoChecks.get(workingDir) === check) {
+      executionContext.gitRepoChecks.delete(workingDir);
+    }
+  };
+  check.then((isRepo) => {
+    if (!isRepo) {
+      forget();
+    }
+  }, forget);
+  return check;
+}
+
 function getWorkflowPlatformClient(
   executionContext: WorkflowExecutionContext,
   platform: WorkflowPlatform
@@ -441,7 +483,7 @@ function createAgentOptions(
 async function writeWorkflowFile(
   workingDir: string,
   relativeOutputPath: string,
-  content: string
+  content: string | Iterable<string>
 ): Promise<void> {
   if (!relativeOutputPath.trim()) {
     throw new Error('Workflow output path cannot be empty.');
@@ -855,12 +897,10 @@ async function requireWorkflowGitRepo(
   workingDir: string,
   executionContext: WorkflowExecutionContext
 ) {
-  const git = getWorkflowGitClient(executionContext, workingDir);
-  const isRepo = await git.checkIsRepo();
-  if (!isRepo) {
+  if (!(await isWorkflowGitRepo(executionContext, workingDir))) {
     throw new Error(`Workflow git node "${nodeId}" must run from a git repository.`);
   }
-  return git;
+  return getWorkflowGitClient(executionContext, workingDir);
 }
 
 async function runGitDiffWorkflowNode(
@@ -870,11 +910,10 @@ async function runGitDiffWorkflowNode(
   context: WorkflowTemplateContext,
   executionContext: WorkflowExecutionContext
 ): Promise<WorkflowNodeResult> {
-  const git = getWorkflowGitClient(executionContext, workingDir);
-  const isRepo = await git.checkIsRepo();
-  if (!isRepo) {
+  if (!(await isWorkflowGitRepo(executionContext, workingDir))) {
     throw new Error(`Workflow git-diff node "${nodeId}" must run from a git repository.`);
   }
+  const git = getWorkflowGitClient(executionContext, workingDir);
 
   const staged = getBooleanActionOption(node, 'staged', context);
   const diff = staged ? await git.diff(['--cached']) : await git.diff();
@@ -1652,13 +1691,13 @@ async function loadLocalChangeSource(
   nodeId: string,
   node: WorkflowNodeConfig,
   workingDir: string,
-  context: WorkflowTemplateContext
+  context: WorkflowTemplateContext,
+  executionContext: WorkflowExecutionContext
 ): Promise<ReviewSource> {
-  const git = simpleGit({ baseDir: workingDir });
-  const isRepo = await git.checkIsRepo();
-  if (!isRepo) {
+  if (!(await isWorkflowGitRepo(executionContext, workingDir))) {
     throw new Error(`Workflow change-source node "${nodeId}" must run from a git repository.`);
   }
+  const git = getWorkflowGitClient(executionContext, workingDir);
 
   const staged = getBooleanActionOption(node, 'staged', context);
   const diffText = staged ? await git.diff(['--cached']) : await git.diff();
@@ -1883,54 +1922,106 @@ async function loadGitHubChangeSource(
   );
 }
 
-async function loadGitLabChangeSource(
+function getGitLabChangeSourceCacheKey(
+  projectId: string,
+  mrIid: number,
+  pullRequest: PullRequest
+): ChangeSourceCacheKey {
+  return {
+    platform: 'gitlab',
+    projectId,
+    number: mrIid,
+    headSha: pullRequest.headSha,
+    baseSha: pullRequest.baseSha ?? '',
+  };
+}
+
+/**
+ * Load a merge request file snapshot through the DRS_CACHE_DIR cache
+ *
+ * Entries are keyed by the head and base commits of the fetched merge request, and a fresh
+ * snapshot is only stored when GitLab reports the same head, so a push racing the fetch
+ * cannot poison the entry.
+ */
+async function loadCachedGitLabChangedFilesSnapshot(
+  cacheDir: string,
+  projectId: string,
+  mrIid: number,
+  pullRequest: PullRequest,
+  fetchSnapshot: () => Promise<ChangedFilesSnapshot>
+): Promise<ChangedFilesSnapshot> {
+  const key = getGitLabChangeSourceCacheKey(projectId, mrIid, pullRequest);
+  const cached = await readCachedChangedFilesSnapshot(cacheDir, key);
+  if (cached) {
+    return cached;
+  }
+
+  const snapshot = await fetchSnapshot();
+  if (snapshot.headSha === pullRequest.headSha) {
+    await writeCachedChangedFilesSnapshot(cacheDir, key, snapshot);
+  }
+  return snapshot;
+}
+
+function getReportedGitLabFileCount(pullRequest: PullRequest): number | undefined {
+  const platformData = pullRequest.platformData;
+  const reportedFileCount =
+    platformData && typeof platformData === 'object' && 'changes_count' in platformData
+      ? platformData.changes_count
+      : undefined;
+  const expectedFileCount =
+    typeof reportedFileCount === 'number'
+      ? reportedFileCount
+      : typeof reportedFileCount === 'string' && /^\d+$/.test(reportedFileCount)
+        ? Number(reportedFileCount)
+        : undefined;
+  return expectedFileCount !== undefined && Number.isSafeInteger(expectedFileCount)
+    ? expectedFileCount
+    : undefined;
+}
+
+/**
+ * Load a stable, complete GitLab file snapshot
+ *
+ * The merge request is read before and after the snapshot so a push in between is rejected.
+ * With DRS_CACHE_DIR, only complete cached snapshots are used, a cached snapshot that fails
+ * the file-count check is dropped and refetched once, and a fresh snapshot is stored only
+ * after every check passes so a failed run never pins its result for later retries.
+ */
+async function loadCompleteGitLabChangeSource(
   nodeId: string,
-  node: WorkflowNodeConfig,
-  workingDir: string,
-  context: WorkflowTemplateContext,
-  executionContext: WorkflowExecutionContext
-): Promise<ReviewSource> {
-  const projectId = hasActionOption(node, 'project')
-    ? requireStringActionOption(nodeId, node, 'project', context)
-    : requireStringActionOption(nodeId, node, 'projectId', context);
-  const mrIid = hasActionOption(node, 'mr')
-    ? requireNumberActionOption(nodeId, node, 'mr', context)
-    : requireNumberActionOption(nodeId, node, 'mrIid', context);
-  const platformClient = getWorkflowPlatformClient(executionContext, 'gitlab');
-  const requireCompleteDiff = getBooleanActionOption(node, 'requireCompleteDiff', context);
-  let pullRequest: PullRequest;
-  let changedFiles: FileChange[];
-  if (requireCompleteDiff) {
+  platformClient: PlatformClient,
+  projectId: string,
+  mrIid: number,
+  cacheDir: string | undefined
+): Promise<{ pullRequest: PullRequest; changedFiles: FileChange[] }> {
+  const getChangedFilesSnapshot = platformClient.getChangedFilesSnapshot?.bind(platformClient);
+  if (!getChangedFilesSnapshot) {
+    throw new Error(
+      `Workflow change-source node "${nodeId}" cannot verify GitLab diff completeness.`
+    );
+  }
+
+  let useCache = cacheDir !== undefined;
+  for (;;) {
     const before = await platformClient.getPullRequest(projectId, mrIid);
-    if (!platformClient.getChangedFilesSnapshot) {
-      throw new Error(
-        `Workflow change-source node "${nodeId}" cannot verify GitLab diff completeness.`
-      );
-    }
-    const snapshot = await platformClient.getChangedFilesSnapshot(projectId, mrIid);
-    changedFiles = snapshot.files;
+    const cacheKey = getGitLabChangeSourceCacheKey(projectId, mrIid, before);
+    const cached =
+      cacheDir && useCache ? await readCachedChangedFilesSnapshot(cacheDir, cacheKey) : undefined;
+    const snapshot = cached?.complete ? cached : await getChangedFilesSnapshot(projectId, mrIid);
+    const fromCache = snapshot === cached;
     const after = await platformClient.getPullRequest(projectId, mrIid);
     if (!before.headSha || before.headSha !== after.headSha) {
       throw new Error(
         `Workflow change-source node "${nodeId}" cannot review an unstable merge request head.`
       );
     }
-    const platformData = after.platformData;
-    const reportedFileCount =
-      platformData && typeof platformData === 'object' && 'changes_count' in platformData
-        ? platformData.changes_count
-        : undefined;
-    const expectedFileCount =
-      typeof reportedFileCount === 'number'
-        ? reportedFileCount
-        : typeof reportedFileCount === 'string' && /^\d+$/.test(reportedFileCount)
-          ? Number(reportedFileCount)
-          : undefined;
-    if (
-      expectedFileCount === undefined ||
-      !Number.isSafeInteger(expectedFileCount) ||
-      expectedFileCount !== changedFiles.length
-    ) {
+    if (getReportedGitLabFileCount(after) !== snapshot.files.length) {
+      if (cacheDir && fromCache) {
+        await removeCachedChangedFilesSnapshot(cacheDir, cacheKey);
+        useCache = false;
+        continue;
+      }
       throw new Error(
         `Workflow change-source node "${nodeId}" did not receive the complete GitLab file list.`
       );
@@ -1942,7 +2033,55 @@ async function loadGitLabChangeSource(
         `Workflow change-source node "${nodeId}" did not receive complete GitLab patches${suffix}`
       );
     }
-    pullRequest = after;
+    if (cacheDir && !fromCache && snapshot.headSha === after.headSha) {
+      await writeCachedChangedFilesSnapshot(
+        cacheDir,
+        getGitLabChangeSourceCacheKey(projectId, mrIid, after),
+        snapshot
+      );
+    }
+    return { pullRequest: after, changedFiles: snapshot.files };
+  }
+}
+
+async function loadGitLabChangeSource(
+  nodeId: string,
+  node: WorkflowNodeConfig,
+  workingDir: string,
+  context: WorkflowTemplateContext,
+  executionContext: WorkflowExecutionContext
+): Promise<ReviewSource> {
+  const projectId = hasActionOption(node, 'project')
+    ? requireStringActionOption(nodeId, node, 'project', context)
+    : requireStringActionOption(nodeId, node, 'projectId', context);
+  const mrIid = hasActionOption(node, 'mr')
+    ? requireNumberActionOption(nodeId, node, 'mr', context)
+    : requireNumberActionOption(nodeId, node, 'mrIid', context);
+  const platformClient = getWorkflowPlatformClient(executionContext, 'gitlab');
+  const requireCompleteDiff = getBooleanActionOption(node, 'requireCompleteDiff', context);
+  const cacheDir = getChangeSourceCacheDir();
+  let pullRequest: PullRequest;
+  let changedFiles: FileChange[];
+  if (requireCompleteDiff) {
+    ({ pullRequest, changedFiles } = await loadCompleteGitLabChangeSource(
+      nodeId,
+      platformClient,
+      projectId,
+      mrIid,
+      cacheDir
+    ));
+  } else if (cacheDir && platformClient.getChangedFilesSnapshot) {
+    // The cache key needs the current head, so the merge request is fetched first.
+    const getChangedFilesSnapshot = platformClient.getChangedFilesSnapshot.bind(platformClient);
+    pullRequest = await platformClient.getPullRequest(projectId, mrIid);
+    const snapshot = await loadCachedGitLabChangedFilesSnapshot(
+      cacheDir,
+      projectId,
+      mrIid,
+      pullRequest,
+      () => getChangedFilesSnapshot(projectId, mrIid)
+    );
+    changedFiles = snapshot.files;
   } else {
     [pullRequest, changedFiles] = await Promise.all([
       platformClient.getPullRequest(projectId, mrIid),
@@ -2052,7 +2191,7 @@ async function runChangeSourceWorkflowNode(
   const type = getStringActionOption(node, 'type', context) ?? 'local';
   let source: ReviewSource;
   if (type === 'local') {
-    source = await loadLocalChangeSource(nodeId, node, workingDir, context);
+    source = await loadLocalChangeSource(nodeId, node, workingDir, context, executionContext);
   } else if (type === 'git-range') {
     source = await loadGitRangeChangeSource(nodeId, node, workingDir, context, executionContext);
   } else if (type === 'github-pr') {
@@ -2495,7 +2634,13 @@ async function runCodeQualityReportWorkflowNode(
   }
 
   const report = generateCodeQualityReport(reviewResult.issues);
-  await writeWorkflowFile(workingDir, reportPath, formatCodeQualityReport(report));
+  await writeWorkflowFile(
+    workingDir,
+    reportPath,
+    formatCodeQualityReportChunks(report, {
+      pretty: getBooleanActionOption(node, 'pretty', context),
+    })
+  );
 
   return {
     id: nodeId,
@@ -3862,6 +4007,7 @@ export async function runWorkflowNodeLocally(
 ): Promise<WorkflowNodeResult> {
   const executionContext: WorkflowExecutionContext = {
     gitClients: new Map(),
+    gitRepoChecks: new Map(),
     platformClients: {},
     traceCollector: options.trace ? new TraceCollector() : undefined,
     locks: {
@@ -3972,6 +4118,7 @@ async function executeWorkflowRun(
   const context: WorkflowTemplateContext = { startedAt, inputs, nodes, artifacts, loop };
   const executionContext: WorkflowExecutionContext = {
     gitClients: new Map(),
+    gitRepoChecks: new Map(),
     platformClients: {},
     traceCollector: options.trace ? new TraceCollector() : undefined,
     locks: {
@@ -1,5 +1,5 @@
-import { describe, expect, it, vi } from 'vitest';
-import { GitLabClient, resolveGitLabCommitEmailDomain } from './client.js';
+import { afterEach, describe, expect, it, vi } from 'vitest';
+import { createGitLabClient, GitLabClient, resolveGitLabCommitEmailDomain } from './client.js';
 
 describe('resolveGitLabCommitEmailDomain', () => {
   it('derives the GitLab.com private commit email domain', () => {
@@ -57,3 +57,26 @@ describe('GitLabClient changes snapshots', () => {
     });
   });
 });
+
+describe('createGitLabClient', () => {
+  afterEach(() => {
+    vi.unstubAllEnvs();
+  });
+
+  it('reuses one client per GitLab URL and token', () => {
+    vi.stubEnv('GITLAB_URL', 'https://gitlab.example.com');
+    vi.stubEnv('GITLAB_TOKEN', 'token-a');
+
+    const first = createGitLabClient();
+    expect(createGitLabClient()).toBe(first);
+
+    vi.stubEnv('GITLAB_TOKEN', 'token-b');
+    expect(createGitLabClient()).not.toBe(first);
+  });
+
+  it('requires a GitLab token', () => {
+    vi.stubEnv('GITLAB_TOKEN', '');
+
+    expect(() => createGitLabClient()).toThrow('GITLAB_TOKEN environment variable is required');
+  });
+});
@@ -20,6 +20,7 @@ export interface MRChange {
 export interface MRChangesSnapshot {
   changes: MRChange[];
   overflow?: boolean;
+  headSha?: string;
 }
 
 export function resolveGitLabCommitEmailDomain(url: string, configuredDomain?: string): string {
@@ -63,6 +64,7 @@ export class GitLabClient {
   async getMRChangesSnapshot(projectId: string, mrIid: number): Promise<MRChangesSnapshot> {
     const mr = (await this.client.MergeRequests.changes(projectId, mrIid)) as {
       overflow?: boolean;
+      diff_refs?: { head_sha?: string };
       changes?: Array<{
         old_path: string;
         new_path: string;
@@ -76,6 +78,7 @@ export class GitLabClient {
     };
     return {
       overflow: mr.overflow,
+      headSha: mr.diff_refs?.head_sha,
       changes: (mr.changes ?? []).map((change) => ({
         oldPath: change.old_path,
         newPath: change.new_path,
@@ -208,8 +211,14 @@ export class GitLabClient {
   }
 }
 
+const sharedClients = new Map<string, GitLabClient>();
+
 /**
  * Create a GitLab client from environment variables
+ *
+ * Clients are shared per process for the same URL, token, and commit email
+ * domain so repeated MR lookups (for example one per Temporal activity) reuse
+ * the same API client and its pooled HTTP connections.
  */
 export function createGitLabClient(): GitLabClient {
   const url = process.env.GITLAB_URL ?? 'https://gitlab.com';
@@ -219,9 +228,14 @@ export function createGitLabClient(): GitLabClient {
     throw new Error('GITLAB_TOKEN environment variable is required');
   }
 
-  return new GitLabClient({
-    url,
-    token,
-    commitEmailDomain: process.env.GITLAB_COMMIT_EMAIL_DOMAIN,
-  });
+  const commitEmailDomain = process.env.GITLAB_COMMIT_EMAIL_DOMAIN;
+  const key = [url, token, commitEmailDomain ?? ''].join('\0');
+  const existing = sharedClients.get(key);
+  if (existing) {
+    return existing;
+  }
+
+  const client = new GitLabClient({ url, token, commitEmailDomain });
+  sharedClients.set(key, client);
+  return client;
 }
@@ -45,6 +45,7 @@ interface GitLabMergeRequest {
   target_branch: string;
   sha?: string;
   diff_refs?: {
+    base_sha?: string;
     head_sha?: string;
   };
 }
@@ -78,6 +79,7 @@ export class GitLabPlatformAdapter implements PlatformClient {
       sourceBranch: mr.source_branch,
       targetBranch: mr.target_branch,
       headSha: mr.diff_refs?.head_sha ?? mr.sha ?? '',
+      baseSha: mr.diff_refs?.base_sha,
       platformData: mr,
     };
   }
@@ -106,6 +108,7 @@ export class GitLabPlatformAdapter implements PlatformClient {
       files: snapshot.changes.map((change) => this.mapChangedFile(change)),
       complete: snapshot.overflow === false && incompleteFiles.length === 0,
       incompleteFiles,
+      headSha: snapshot.headSha,
     };
   }
 
@@ -4,6 +4,8 @@ import { lstat, readFile, readlink, realpath } from 'fs/promises';
 import { isAbsolute, relative, resolve, sep } from 'path';
 import { minimatch } from 'minimatch';
 import { promisify } from 'util';
+import { mapWithConcurrency } from './async-utils.js';
+import { toPosixPath } from './path-utils.js';
 
 export interface AgentPathPermissions {
   roots: string[];
@@ -44,6 +46,7 @@ export interface AgentWorkspaceChanges {
 }
 
 const execFileAsync = promisify(execFile);
+const WORKSPACE_FINGERPRINT_CONCURRENCY = 8;
 
 const PERMISSION_FIELDS = new Set(['filesystem', 'shell']);
 const FILESYSTEM_FIELDS = new Set(['read', 'write', 'delete']);
@@ -235,10 +238,12 @@ export async function captureAgentWorkspaceSnapshot(
   }
 
   const files = Object.create(null) as Record<string, string>;
-  for (const filePath of output.split('\0').filter(Boolean).sort()) {
-    const fingerprint = await fingerprintWorkspacePath(root, filePath);
+  const filePaths = output.split('\0').filter(Boolean).sort();
+  const fingerprints = await fingerprintWorkspacePaths(root, filePaths);
+  filePaths.forEach((filePath, index) => {
+    const fingerprint = fingerprints[index];
     if (fingerprint) files[toPosixPath(filePath)] = fingerprint;
-  }
+  });
   return { files };
 }
 
@@ -402,6 +407,20 @@ async function fingerprintWorkspacePath(
   }
 }
 
+/**
+ * Fingerprint paths with a bounded number of reads in flight, preserving input order.
+ */
+async function fingerprintWorkspacePaths(
+  workingDir: string,
+  relativePaths: string[]
+): Promise<Array<string | null>> {
+  return await mapWithConcurrency(
+    relativePaths,
+    WORKSPACE_FINGERPRINT_CONCURRENCY,
+    (relativePath) => fingerprintWorkspacePath(workingDir, relativePath)
+  );
+}
+
 async function fingerprintNestedGitWorkspace(workingDir: string): Promise<string | null> {
   try {
     const [headResult, diffResult, untrackedResult] = await Promise.all([
@@ -422,10 +441,12 @@ async function fingerprintNestedGitWorkspace(workingDir: string): Promise<string
     ]);
     const hash = createHash('sha256');
     hash.update(`head:${headResult.stdout.trim()}\0diff:\0${diffResult.stdout}\0`);
-    for (const filePath of untrackedResult.stdout.split('\0').filter(Boolean).sort()) {
-      const fingerprint = await fingerprintWorkspacePath(workingDir, filePath);
+    const untrackedPaths = untrackedResult.stdout.split('\0').filter(Boolean).sort();
+    const fingerprints = await fingerprintWorkspacePaths(workingDir, untrackedPaths);
+    untrackedPaths.forEach((filePath, index) => {
+      const fingerprint = fingerprints[index];
       if (fingerprint) hash.update(`untracked:${toPosixPath(filePath)}\0${fingerprint}\0`);
-    }
+    });
     return hash.digest('hex');
   } catch {
     return null;
@@ -453,10 +474,6 @@ function rejectUnknownFields(
   }
 }
 
-function toPosixPath(value: string): string {
-  return sep === '/' ? value : value.split(sep).join('/');
-}
-
 function isRecord(value: unknown): value is Record<string, unknown> {
   return value !== null && typeof value === 'object' && !Array.isArray(value);
 }
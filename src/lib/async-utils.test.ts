@@ -0,0 +1,24 @@
+import { describe, expect, it } from 'vitest';
+import { mapWithConcurrency } from './async-utils.js';
+
+describe('mapWithConcurrency', () => {
+  it('preserves input order and never exceeds the limit', async () => {
+    let inFlight = 0;
+    let maxInFlight = 0;
+
+    const results = await mapWithConcurrency([30, 10, 20, 0, 5], 2, async (delay, index) => {
+      inFlight += 1;
+      maxInFlight = Math.max(maxInFlight, inFlight);
+      await new Promise((resolve) => setTimeout(resolve, delay));
+      inFlight -= 1;
+      return index * 10;
+    });
+
+    expect(results).toEqual([0, 10, 20, 30, 40]);
+    expect(maxInFlight).toBe(2);
+  });
+
+  it('handles an empty list', async () => {
+    await expect(mapWithConcurrency([], 4, async () => 1)).resolves.toEqual([]);
+  });
+});
@@ -0,0 +1,146 @@
+import { mkdtemp, readdir, rm, utimes, writeFile } from 'fs/promises';
+import { join } from 'path';
+import { tmpdir } from 'os';
+import { afterEach, describe, expect, it, vi } from 'vitest';
+import {
+  CHANGE_SOURCE_CACHE_TTL_MS,
+  getChangeSourceCacheDir,
+  readCachedChangedFilesSnapshot,
+  removeCachedChangedFilesSnapshot,
+  writeCachedChangedFilesSnapshot,
+  type ChangeSourceCacheKey,
+} from './change-source-cache.js';
+import type { ChangedFilesSnapshot } from './platform-client.js';
+
+const tempDirs: string[] = [];
+
+async function createTempCacheDir(): Promise<string> {
+  const dir = await mkdtemp(join(tmpdir(), 'drs-change-source-cache-'));
+  tempDirs.push(dir);
+  return dir;
+}
+
+const key: ChangeSourceCacheKey = {
+  platform: 'gitlab',
+  projectId: 'group/repo',
+  number: 8,
+  headSha: 'head-1',
+  baseSha: 'base-1',
+};
+
+const snapshot: ChangedFilesSnapshot = {
+  files: [
+    {
+      filename: 'src/index.ts',
+      status: 'modified',
+      additions: 0,
+      deletions: 0,
+      patch: '@@ -1 +1 @@\n-old\n+new',
+    },
+  ],
+  complete: true,
+  incompleteFiles: [],
+  headSha: 'head-1',
+};
+
+describe('change-source-cache', () => {
+  afterEach(async () => {
+    vi.unstubAllEnvs();
+    await Promise.all(tempDirs.splice(0).map((dir) => rm(dir, { recursive: true, force: true })));
+  });
+
+  it('is disabled unless DRS_CACHE_DIR is set', () => {
+    vi.stubEnv('DRS_CACHE_DIR', '');
+    expect(getChangeSourceCacheDir()).toBeUndefined();
+
+    vi.stubEnv('DRS_CACHE_DIR', '/tmp/drs-cache');
+    expect(getChangeSourceCacheDir()).toBe(join('/tmp/drs-cache', 'change-sources'));
+  });
+
+  it('round-trips complete snapshots for the same commits', async () => {
+    const cacheDir = await createTempCacheDir();
+
+    await writeCachedChangedFilesSnapshot(cacheDir, key, snapshot);
+
+    await expect(readCachedChangedFilesSnapshot(cacheDir, key)).resolves.toEqual({
+      files: snapshot.files,
+      complete: true,
+      incompleteFiles: [],
+    });
+    await expect(
+      readCachedChangedFilesSnapshot(cacheDir, { ...key, headSha: 'head-2' })
+    ).resolves.toBeUndefined();
+    await expect(
+      readCachedChangedFilesSnapshot(cacheDir, { ...key, baseSha: 'base-2' })
+    ).resolves.toBeUndefined();
+  });
+
+  it('round-trips incomplete snapshots', async () => {
+    const cacheDir = await createTempCacheDir();
+    const incomplete = { ...snapshot, complete: false, incompleteFiles: ['src/index.ts'] };
+
+    await writeCachedChangedFilesSnapshot(cacheDir, key, incomplete);
+
+    await expect(readCachedChangedFilesSnapshot(cacheDir, key)).resolves.toEqual({
+      files: snapshot.files,
+      complete: false,
+      incompleteFiles: ['src/index.ts'],
+    });
+  });
+
+  it('does not store entries without commits', async () => {
+    const cacheDir = await createTempCacheDir();
+
+    await writeCachedChangedFilesSnapshot(cacheDir, { ...key, baseSha: '' }, snapshot);
+    await writeCachedChangedFilesSnapshot(cacheDir, { ...key, headSha: '' }, snapshot);
+
+    await expect(readdir(cacheDir)).resolves.toEqual([]);
+  });
+
+  it.each([
+    { files: [{ filename: 'src/index.ts' }], complete: true, incompleteFiles: [] },
+    { files: [{ ...snapshot.files[0], patch: 42 }], complete: true, incompleteFiles: [] },
+    { files: ['src/index.ts'], complete: true, incompleteFiles: [] },
+    { files: snapshot.files, complete: 'yes', incompleteFiles: [] },
+    { files: snapshot.files, complete: false, incompleteFiles: [1] },
+  ])('ignores malformed entries: %j', async (entry) => {
+    const cacheDir = await createTempCacheDir();
+    await writeCachedChangedFilesSnapshot(cacheDir, key, snapshot);
+    const [entryName] = await readdir(cacheDir);
+    await writeFile(join(cacheDir, entryName), JSON.stringify(entry), 'utf-8');
+
+    await expect(readCachedChangedFilesSnapshot(cacheDir, key)).resolves.toBeUndefined();
+  });
+
+  it('leaves only the entry behind after a write', async () => {
+    const cacheDir = await createTempCacheDir();
+
+    await writeCachedChangedFilesSnapshot(cacheDir, key, snapshot);
+    await writeCachedChangedFilesSnapshot(cacheDir, key, snapshot);
+
+    const entries = await readdir(cacheDir);
+    expect(entries).toHaveLength(1);
+    expect(entries[0]).toMatch(/^[0-9a-f]+\.json$/);
+  });
+
+  it('removes entries', async () => {
+    const cacheDir = await createTempCacheDir();
+    await writeCachedChangedFilesSnapshot(cacheDir, key, snapshot);
+
+    await removeCachedChangedFilesSnapshot(cacheDir, key);
+    await removeCachedChangedFilesSnapshot(cacheDir, key);
+
+    await expect(readCachedChangedFilesSnapshot(cacheDir, key)).resolves.toBeUndefined();
+    await expect(readdir(cacheDir)).resolves.toEqual([]);
+  });
+
+  it('ignores expired entries', async () => {
+    const cacheDir = await createTempCacheDir();
+    await writeCachedChangedFilesSnapshot(cacheDir, key, snapshot);
+    const [entry] = await readdir(cacheDir);
+    const expired = new Date(Date.now() - CHANGE_SOURCE_CACHE_TTL_MS - 60_000);
+    await utimes(join(cacheDir, entry), expired, expired);
+
+    await expect(readCachedChangedFilesSnapshot(cacheDir, key)).resolves.toBeUndefined();
+  });
+});
@@ -0,0 +1,130 @@
+/**
+ * On-disk cache for merge request file snapshots
+ *
+ * CI pipelines often run DRS several times against the same merge request head
+ * (review, describe, code quality). Snapshots are keyed by the commits GitLab computed
+ * the diff from, so a push or a rebase misses the cache instead of serving stale patches.
+ * Binary, collapsed, and oversized files depend only on those commits, so snapshots are
+ * cached whether or not every patch was available; callers that require a complete diff
+ * check completeness themselves.
+ * The cache is opt-in through DRS_CACHE_DIR and best-effort: read or write failures fall
+ * back to fetching from the platform.
+ */
+
+import { createHash, randomUUID } from 'crypto';
+import { mkdir, readFile, rename, rm, stat, writeFile } from 'fs/promises';
+import { join } from 'path';
+import type { ChangedFilesSnapshot } from './platform-client.js';
+
+/** Entries older than this are refetched even if their commits still match */
+export const CHANGE_SOURCE_CACHE_TTL_MS = 24 * 60 * 60 * 1000;
+
+export interface ChangeSourceCacheKey {
+  platform: 'github' | 'gitlab';
+  projectId: string;
+  number: number;
+  headSha: string;
+  baseSha: string;
+}
+
+/**
+ * Resolve the cache directory, or undefined when caching is disabled
+ */
+export function getChangeSourceCacheDir(): string | undefined {
+  const dir = process.env.DRS_CACHE_DIR?.trim();
+  return dir ? join(dir, 'change-sources') : undefined;
+}
+
+function getCacheEntryPath(cacheDir: string, key: ChangeSourceCacheKey): string {
+  const digest = createHash('sha256')
+    .update(JSON.stringify([key.platform, key.projectId, key.number, key.headSha, key.baseSha]))
+    .digest('hex');
+  return join(cacheDir, `${digest}.json`);
+}
+
+function isRecord(value: unknown): value is Record<string, unknown> {
+  return value !== null && typeof value === 'object' && !Array.isArray(value);
+}
+
+function isCachedFileChange(value: unknown): boolean {
+  return (
+    isRecord(value) &&
+    typeof value.filename === 'string' &&
+    typeof value.status === 'string' &&
+    typeof value.additions === 'number' &&
+    typeof value.deletions === 'number' &&
+    (value.patch === undefined || typeof value.patch === 'string') &&
+    (value.previousFilename === undefined || typeof value.previousFilename === 'string')
+  );
+}
+
+function isCachedSnapshot(value: unknown): value is ChangedFilesSnapshot {
+  return (
+    isRecord(value) &&
+    Array.isArray(value.files) &&
+    value.files.every(isCachedFileChange) &&
+    typeof value.complete === 'boolean' &&
+    Array.isArray(value.incompleteFiles) &&
+    value.incompleteFiles.every((file) => typeof file === 'string')
+  );
+}
+
+/**
+ * Read a cached snapshot, returning undefined on a miss, an expired entry, or a bad file
+ */
+export async function readCachedChangedFilesSnapshot(
+  cacheDir: string,
+  key: ChangeSourceCacheKey
+): Promise<ChangedFilesSnapshot | undefined> {
+  if (!key.headSha || !key.baseSha) return undefined;
+  const entryPath = getCacheEntryPath(cacheDir, key);
+  try {
+    const { mtimeMs } = await stat(entryPath);
+    if (Date.now() - mtimeMs > CHANGE_SOURCE_CACHE_TTL_MS) return undefined;
+    const parsed: unknown = JSON.parse(await readFile(entryPath, 'utf-8'));
+    return isCachedSnapshot(parsed) ? parsed : undefined;
+  } catch {
+    return undefined;
+  }
+}
+
+/**
+ * Store a snapshot for the commits in the key
+ */
+export async function writeCachedChangedFilesSnapshot(
+  cacheDir: string,
+  key: ChangeSourceCacheKey,
+  snapshot: ChangedFilesSnapshot
+): Promise<void> {
+  if (!key.headSha || !key.baseSha) return;
+  const entryPath = getCacheEntryPath(cacheDir, key);
+  // PIDs alone collide across CI containers sharing a volume, so the suffix is random.
+  const tempPath = `${entryPath}.tmp-${process.pid}-${randomUUID()}`;
+  try {
+    await mkdir(cacheDir, { recursive: true });
+    await writeFile(
+      tempPath,
+      JSON.stringify({
+        files: snapshot.files,
+        complete: snapshot.complete,
+        incompleteFiles: snapshot.incompleteFiles,
+      }),
+      { encoding: 'utf-8', flag: 'wx' }
+    );
+    // Rename so concurrent jobs sharing the directory never read a partial entry.
+    await rename(tempPath, entryPath);
+  } catch {
+    // The cache is an optimization; failing to populate it must not fail the run.
+    await rm(tempPath, { force: true }).catch(() => undefined);
+  }
+}
+
+/**
+ * Drop a cached snapshot that turned out not to match the platform
+ */
+export async function removeCachedChangedFilesSnapshot(
+  cacheDir: string,
+  key: ChangeSourceCacheKey
+): Promise<void> {
+  await rm(getCacheEntryPath(cacheDir, key), { force: true }).catch(() => undefined);
+}
@@ -3,6 +3,7 @@ import {
   convertToCodeQualityIssue,
   generateCodeQualityReport,
   formatCodeQualityReport,
+  formatCodeQualityReportChunks,
   type CodeQualityIssue,
 } from './code-quality-report.js';
 import type { ReviewIssue } from './comment-formatter.js';
@@ -331,13 +332,32 @@ describe('code-quality-report', () => {
         },
       ];
 
-      const json = formatCodeQualityReport(report);
+      const json = formatCodeQualityReport(report, { pretty: true });
 
       // Should have indentation (pretty printed)
       expect(json).toContain('\n');
       expect(json).toContain('  ');
     });
 
+    it('should format compactly by default', () => {
+      const report: CodeQualityIssue[] = [
+        {
+          description: 'Test issue',
+          check_name: 'drs-test',
+          fingerprint: 'test123',
+          severity: 'minor',
+          location: {
+            path: 'test.ts',
+            lines: {
+              begin: 1,
+            },
+          },
+        },
+      ];
+
+      expect(formatCodeQualityReport(report)).toBe(JSON.stringify(report));
+    });
+
     it('should handle empty report', () => {
       const json = formatCodeQualityReport([]);
       expect(json).toBe('[]');
@@ -371,4 +391,34 @@ describe('code-quality-report', () => {
       expect(parsed[0].location.lines).toHaveProperty('begin');
     });
   });
+
+  describe('formatCodeQualityReportChunks', () => {
+    const issue = (path: string, begin: number): CodeQualityIssue => ({
+      description: 'Line one\nline two',
+      check_name: 'drs-security',
+      fingerprint: `fp-${path}`,
+      severity: 'major',
+      location: { path, lines: { begin } },
+    });
+
+    it('should match formatCodeQualityReport output', () => {
+      const report = [issue('src/a.ts', 1), issue('src/b.ts', 2)];
+
+      expect([...formatCodeQualityReportChunks(report)].join('')).toBe(
+        formatCodeQualityReport(report)
+      );
+    });
+
+    it('should match pretty formatCodeQualityReport output', () => {
+      const report = [issue('src/a.ts', 1), issue('src/b.ts', 2)];
+
+      expect([...formatCodeQualityReportChunks(report, { pretty: true })].join('')).toBe(
+        formatCodeQualityReport(report, { pretty: true })
+      );
+    });
+
+    it('should handle empty report', () => {
+      expect([...formatCodeQualityReportChunks([])].join('')).toBe('[]');
+    });
+  });
 });
@@ -17,7 +17,7 @@ export interface CodeQualityIssue {
   description: string;
   /** Unique name representing the static analysis check */
   check_name: string;
-  /** Unique fingerprint to identify the violation (e.g., MD5 hash) */
+  /** Unique fingerprint to identify the violation (DRS v2 SHA-256 issue fingerprint) */
   fingerprint: string;
   /** Severity level: info, minor, major, critical, or blocker */
   severity: 'info' | 'minor' | 'major' | 'critical' | 'blocker';
@@ -33,26 +33,28 @@ export interface CodeQualityIssue {
   };
 }
 
+const SEVERITY_MAP: Readonly<Record<string, CodeQualityIssue['severity']>> = {
+  CRITICAL: 'blocker',
+  HIGH: 'critical',
+  MEDIUM: 'major',
+  LOW: 'minor',
+  INFO: 'info',
+};
+
+const WHITESPACE_REGEX = /\s+/g;
+
 /**
  * Map DRS severity to GitLab code quality severity
  */
 function mapSeverity(drsSeverity: string): CodeQualityIssue['severity'] {
-  const severityMap: Record<string, CodeQualityIssue['severity']> = {
-    CRITICAL: 'blocker',
-    HIGH: 'critical',
-    MEDIUM: 'major',
-    LOW: 'minor',
-    INFO: 'info',
-  };
-
-  return severityMap[drsSeverity] || 'info';
+  return Object.hasOwn(SEVERITY_MAP, drsSeverity) ? SEVERITY_MAP[drsSeverity] : 'info';
 }
 
 /**
  * Generate check name from category and severity
  */
 function generateCheckName(issue: ReviewIssue): string {
-  const category = issue.category.toLowerCase().replace(/\s+/g, '-');
+  const category = issue.category.toLowerCase().replace(WHITESPACE_REGEX, '-');
   return `drs-${category}`;
 }
 
@@ -87,9 +89,49 @@ export function generateCodeQualityReport(issues: ReviewIssue[]): CodeQualityIss
   return issues.map(convertToCodeQualityIssue);
 }
 
+export interface FormatCodeQualityReportOptions {
+  /** Indent the JSON for human debugging; GitLab ingests the compact form just as well */
+  pretty?: boolean;
+}
+
 /**
  * Convert code quality report to JSON string
  */
-export function formatCodeQualityReport(report: CodeQualityIssue[]): string {
-  return JSON.stringify(report, null, 2);
+export function formatCodeQualityReport(
+  report: CodeQualityIssue[],
+  options: FormatCodeQualityReportOptions = {}
+): string {
+  return options.pretty ? JSON.stringify(report, null, 2) : JSON.stringify(report);
+}
+
+/**
+ * Serialize a code quality report one issue at a time
+ *
+ * Produces the same text as {@link formatCodeQualityReport} without building the
+ * whole document in memory, so large reports can be streamed straight to disk.
+ */
+export function* formatCodeQualityReportChunks(
+  report: CodeQualityIssue[],
+  options: FormatCodeQualityReportOptions = {}
+): Generator<string> {
+  if (report.length === 0) {
+    yield '[]';
+    return;
+  }
+
+  if (!options.pretty) {
+    yield '[';
+    for (let i = 0; i < report.length; i++) {
+      yield `${i === 0 ? '' : ','}${JSON.stringify(report[i])}`;
+    }
+    yield ']';
+    return;
+  }
+
+  yield '[';
+  for (let i = 0; i < report.length; i++) {
+    const issue = JSON.stringify(report[i], null, 2).replace(/\n/g, '\n  ');
+    yield `${i === 0 ? '' : ','}\n  ${issue}`;
+  }
+  yield '\n]';
 }
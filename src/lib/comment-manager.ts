@@ -11,6 +11,10 @@ export const BOT_COMMENT_ID = 'drs-review-summary';
 // Error comment identifier for tracking error notifications
 export const ERROR_COMMENT_ID = 'drs-error';
 
+const COMMENT_ID_REGEX = /<!-- drs-comment-id: (.*?) -->/;
+const ISSUE_FINGERPRINT_REGEX = /<!-- issue-fp: (.*?) -->/g;
+const ISSUE_SIGNATURE_REGEX = /<!-- issue-sig: (.*?) -->/g;
+
 /**
  * Identity for one exact issue instance and its cross-run continuity key.
  */
@@ -50,36 +54,57 @@ export function createLegacyIssueFingerprint(issue: ReviewIssue): string {
   return `${issue.file}:${line}:${issue.category}:${issue.title}`;
 }
 
+interface NormalizedIssueParts {
+  file: string;
+  line: string;
+  category: string;
+  title: string;
+  problem: string;
+}
+
+function normalizeIssueParts(issue: ReviewIssue): NormalizedIssueParts {
+  return {
+    file: normalizeIssuePath(issue.file),
+    line: issue.line && issue.line > 0 ? String(issue.line) : 'general',
+    category: issue.category,
+    title: normalizeIssueText(issue.title),
+    problem: normalizeIssueText(issue.problem),
+  };
+}
+
+function hashIssueFingerprint(parts: NormalizedIssueParts): string {
+  return hashIssueIdentity('fingerprint', [
+    parts.file,
+    parts.line,
+    parts.category,
+    parts.title,
+    parts.problem,
+  ]);
+}
+
+function hashIssueStableSignature(parts: NormalizedIssueParts): string {
+  return hashIssueIdentity('signature', [parts.file, parts.category, parts.title, parts.problem]);
+}
+
 /**
  * Create an exact, line-sensitive fingerprint for artifact integrity and issue instances.
  */
 export function createIssueFingerprint(issue: ReviewIssue): string {
-  const line = issue.line && issue.line > 0 ? String(issue.line) : 'general';
-  return hashIssueIdentity('fingerprint', [
-    normalizeIssuePath(issue.file),
-    line,
-    issue.category,
-    normalizeIssueText(issue.title),
-    normalizeIssueText(issue.problem),
-  ]);
+  return hashIssueFingerprint(normalizeIssueParts(issue));
 }
 
 /**
  * Create a line-insensitive signature for conservative cross-run continuity matching.
  */
 export function createIssueStableSignature(issue: ReviewIssue): string {
-  return hashIssueIdentity('signature', [
-    normalizeIssuePath(issue.file),
-    issue.category,
-    normalizeIssueText(issue.title),
-    normalizeIssueText(issue.problem),
-  ]);
+  return hashIssueStableSignature(normalizeIssueParts(issue));
 }
 
 export function createIssueIdentity(issue: ReviewIssue): IssueIdentity {
+  const parts = normalizeIssueParts(issue);
   return {
-    fingerprint: createIssueFingerprint(issue),
-    stableSignature: createIssueStableSignature(issue),
+    fingerprint: hashIssueFingerprint(parts),
+    stableSignature: hashIssueStableSignature(parts),
     legacyFingerprint: createLegacyIssueFingerprint(issue),
   };
 }
@@ -88,7 +113,7 @@ export function createIssueIdentity(issue: ReviewIssue): IssueIdentity {
  * Extract bot comment ID from comment body
  */
 export function extractCommentId(body: string): string | null {
-  const match = body.match(/<!-- drs-comment-id: (.*?) -->/);
+  const match = body.match(COMMENT_ID_REGEX);
   return match ? match[1] : null;
 }
 
@@ -97,9 +122,7 @@ export function extractCommentId(body: string): string | null {
  */
 export function extractIssueFingerprints(body: string): Set<string> {
   const fingerprints = new Set<string>();
-  const regex = /<!-- issue-fp: (.*?) -->/g;
-  let match;
-  while ((match = regex.exec(body)) !== null) {
+  for (const match of body.matchAll(ISSUE_FINGERPRINT_REGEX)) {
     fingerprints.add(match[1]);
   }
   return fingerprints;
@@ -110,9 +133,7 @@ export function extractIssueFingerprints(body: string): Set<string> {
  */
 export function extractIssueSignatures(body: string): Set<string> {
   const signatures = new Set<string>();
-  const regex = /<!-- issue-sig: (.*?) -->/g;
-  let match;
-  while ((match = regex.exec(body)) !== null) {
+  for (const match of body.matchAll(ISSUE_SIGNATURE_REGEX)) {
     signatures.add(match[1]);
   }
   return signatures;
@@ -25,9 +25,11 @@ import {
 } from './comment-manager.js';
 import type { PlatformClient, LineValidator, InlineCommentPosition } from './platform-client.js';
 import type { ReviewUsageSummary } from './review-usage.js';
+import { mapWithConcurrency } from './async-utils.js';
 
 const MAX_PLATFORM_COMMENT_LENGTH = 60_000;
 const MAX_INLINE_COMMENTS_PER_REVIEW = 100;
+const STALE_COMMENT_DELETE_CONCURRENCY = 4;
 
 function assertPostBodyWithinLimit(body: string, subject: string): void {
   if (body.length > MAX_PLATFORM_COMMENT_LENGTH) {
@@ -184,21 +186,28 @@ async function removeStaleInlineIssueComments(
     existingInlineComments
   );
 
-  let removed = 0;
-  for (const comment of staleComments) {
-    try {
-      await platformClient.deleteComment(projectId, prNumber, comment.id);
-      removed += 1;
-    } catch (error) {
-      console.warn(
-        chalk.yellow(
-          `Could not remove stale DRS inline comment ${comment.id}: ${
-            error instanceof Error ? error.message : String(error)
-          }`
-        )
-      );
+  // Deletions are independent, but a small cap keeps GitHub's secondary rate limit from
+  // rejecting a burst of writes (each GitHub delete may also fall back to a second request).
+  const deleted = await mapWithConcurrency(
+    staleComments,
+    STALE_COMMENT_DELETE_CONCURRENCY,
+    async (comment) => {
+      try {
+        await platformClient.deleteComment(projectId, prNumber, comment.id);
+        return true;
+      } catch (error) {
+        console.warn(
+          chalk.yellow(
+            `Could not remove stale DRS inline comment ${comment.id}: ${
+              error instanceof Error ? error.message : String(error)
+            }`
+          )
+        );
+        return false;
+      }
     }
-  }
+  );
+  const removed = deleted.filter(Boolean).length;
 
   if (removed > 0) {
     console.log(chalk.gray(`Removed ${removed} stale DRS inline comment(s)\n`));
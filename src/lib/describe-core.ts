@@ -1,32 +1,7 @@
 import type { FileWithDiff } from './review-core.js';
 
-/**
- * Build base instructions for the describe agent.
- *
- * @param label - Human-readable label for the description (e.g., "PR #123", "MR !456")
- * @param files - List of files with optional diff content
- */
-export function buildDescribeInstructions(
-  label: string,
-  files: FileWithDiff[],
-  compressionSummary?: string,
-  projectContext?: string
-): string {
-  const filesWithDiffs = files.filter((f) => f.patch);
-  const hasDiffs = filesWithDiffs.length > 0;
-  const fileList = files.map((f) => `- ${f.filename}`).join('\n');
-  const trimmedContext = projectContext?.trim();
-  const contextSection = trimmedContext
-    ? /^#\s*project context/i.test(trimmedContext.split('\n')[0] ?? '')
-      ? `${trimmedContext}\n\n`
-      : `# Project Context\n\n${trimmedContext}\n\n`
-    : '';
-
-  const diffContent = hasDiffs
-    ? filesWithDiffs.map((f) => `### ${f.filename}\n\`\`\`diff\n${f.patch}\n\`\`\``).join('\n\n')
-    : '';
-
-  const outputSchema = `Output requirements:
+/** Static output contract shared by every describe prompt */
+const DESCRIBE_OUTPUT_REQUIREMENTS = `Output requirements:
 - You MUST call the write_json_output tool with:
   - outputType: "describe_output"
   - payload: the JSON object
@@ -63,6 +38,32 @@ export function buildDescribeInstructions(
   ]
 }`;
 
+/**
+ * Build base instructions for the describe agent.
+ *
+ * @param label - Human-readable label for the description (e.g., "PR #123", "MR !456")
+ * @param files - List of files with optional diff content
+ */
+export function buildDescribeInstructions(
+  label: string,
+  files: FileWithDiff[],
+  compressionSummary?: string,
+  projectContext?: string
+): string {
+  const filesWithDiffs = files.filter((f) => f.patch);
+  const hasDiffs = filesWithDiffs.length > 0;
+  const fileList = files.map((f) => `- ${f.filename}`).join('\n');
+  const trimmedContext = projectContext?.trim();
+  const contextSection = trimmedContext
+    ? /^#\s*project context/i.test(trimmedContext.split('\n')[0] ?? '')
+      ? `${trimmedContext}\n\n`
+      : `# Project Context\n\n${trimmedContext}\n\n`
+    : '';
+
+  const diffContent = hasDiffs
+    ? filesWithDiffs.map((f) => `### ${f.filename}\n\`\`\`diff\n${f.patch}\n\`\`\``).join('\n\n')
+    : '';
+
   return `${contextSection}Generate a comprehensive PR/MR description for ${label}.
 
 Changed files:
@@ -70,7 +71,7 @@ ${fileList}
 
 ${hasDiffs ? `## Diff Content\n\n${diffContent}\n` : ''}
 
-${compressionSummary ? `${compressionSummary}\n\n` : ''}${outputSchema}
+${compressionSummary ? `${compressionSummary}\n\n` : ''}${DESCRIBE_OUTPUT_REQUIREMENTS}
 
 Instructions:
 1. Describe behavior-changing additions, modifications, and deletions in the diff.
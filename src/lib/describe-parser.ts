@@ -1,6 +1,6 @@
 import { readFile } from 'fs/promises';
-import { resolve } from 'path';
 import { OUTPUT_PATHS, type OutputType } from './output-paths.js';
+import { resolveWithinWorkingDir } from './path-utils.js';
 
 const JSON_FENCE_REGEX = /```json\s*([\s\S]*?)\s*```/i;
 
@@ -17,20 +17,8 @@ function isOutputPointer(value: unknown): value is DescribeOutputPointer {
 
 const DESCRIBE_OUTPUT_PATH = OUTPUT_PATHS.describe_output;
 
-function resolveWithinWorkingDir(workingDir: string, targetPath: string): string {
-  const root = resolve(workingDir);
-  const fullPath = resolve(workingDir, targetPath);
-  const rootWithSlash = root.endsWith('/') ? root : `${root}/`;
-
-  if (fullPath !== root && !fullPath.startsWith(rootWithSlash)) {
-    throw new Error(`Refusing to read outside working directory: ${targetPath}`);
-  }
-
-  return fullPath;
-}
-
 async function readJsonIfExists(workingDir: string, targetPath: string): Promise<JsonValue | null> {
-  const resolvedPath = resolveWithinWorkingDir(workingDir, targetPath);
+  const resolvedPath = resolveWithinWorkingDir(workingDir, targetPath, 'read');
   try {
     const fileContents = await readFile(resolvedPath, 'utf-8');
     return JSON.parse(fileContents);
@@ -138,13 +138,14 @@ export async function runDescribeAgent(
   });
 
   let usageByAgent = createAgentUsageSummary(agentType);
-  let fullResponse = '';
+  const responseParts: string[] = [];
   for await (const message of runtimeClient.streamMessages(session.id)) {
     if (message.role === 'assistant') {
       usageByAgent = applyUsageMessage(usageByAgent, message);
-      fullResponse += message.content;
+      responseParts.push(message.content);
     }
   }
+  const fullResponse = responseParts.join('');
 
   let descriptionPayload: Description;
   try {
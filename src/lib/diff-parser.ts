@@ -22,6 +22,8 @@ export interface ParsedDiff {
   isRenamed: boolean;
 }
 
+const HUNK_HEADER_REGEX = /^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@/;
+
 /**
  * Parse a unified diff string into structured format
  */
@@ -87,7 +89,7 @@ export function parseDiff(diffText: string): ParsedDiff[] {
         currentFile.hunks.push(currentHunk);
       }
 
-      const match = line.match(/@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@/);
+      const match = line.match(HUNK_HEADER_REGEX);
       if (match) {
         oldLineNumber = parseInt(match[1]);
         newLineNumber = parseInt(match[3]);
@@ -1,5 +1,8 @@
 import type { ReviewIssue } from './comment-formatter.js';
 
+const JSON_BLOCK_REGEX = /```json\s*([\s\S]*?)\s*```/g;
+const AGENT_NAME_REGEX = /(?:agent|reviewer):\s*(\w+)/i;
+
 /**
  * Parse review issues from agent response messages
  *
@@ -83,12 +86,8 @@ export function parseReviewIssuesWithDiagnostics(
   try {
     // Try to find JSON blocks in the content
     // Look for code blocks with ```json or raw JSON objects
-    const jsonBlockRegex = /```json\s*([\s\S]*?)\s*```/g;
-
-    let match;
-
     // First try to find JSON code blocks
-    while ((match = jsonBlockRegex.exec(content)) !== null) {
+    for (const match of content.matchAll(JSON_BLOCK_REGEX)) {
       try {
         const parsed = JSON.parse(match[1]);
         consume(parsed, match[1]);
@@ -186,7 +185,7 @@ function isValidIssue(obj: unknown): obj is ReviewIssue {
  */
 export function extractAgentName(message: string): string {
   // Try to extract from common patterns like "Agent: security" or "Reviewer: quality"
-  const agentMatch = message.match(/(?:agent|reviewer):\s*(\w+)/i);
+  const agentMatch = message.match(AGENT_NAME_REGEX);
   if (agentMatch) {
     return agentMatch[1];
   }
@@ -1,9 +1,9 @@
 import { randomUUID } from 'crypto';
 import { lstat, readFile, readdir, realpath, rename, rm, writeFile } from 'fs/promises';
-import { isAbsolute, relative, resolve, sep } from 'path';
+import { isAbsolute, relative, resolve } from 'path';
 import * as path from 'path';
 import * as yaml from 'yaml';
-import { resolveWithinWorkingDir } from './path-utils.js';
+import { resolveWithinWorkingDir, toPosixPath } from './path-utils.js';
 import {
   analyzeWikiConceptGraph,
   extractWikiSiteConceptLinks,
@@ -880,10 +880,6 @@ function stripBom(value: string): string {
   return value.replace(/^\uFEFF/u, '');
 }
 
-function toPosixPath(value: string): string {
-  return sep === '/' ? value : value.split(sep).join('/');
-}
-
 function compareStrings(left: string, right: string): number {
   return left < right ? -1 : left > right ? 1 : 0;
 }
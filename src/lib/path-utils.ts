@@ -1,4 +1,4 @@
-import { isAbsolute, relative, resolve } from 'path';
+import { isAbsolute, relative, resolve, sep } from 'path';
 
 /**
  * Resolve a path and ensure it stays within the provided working directory.
@@ -22,3 +22,10 @@ export function resolveWithinWorkingDir(
 
   return fullPath;
 }
+
+/**
+ * Convert a platform-specific path to forward-slash separators.
+ */
+export function toPosixPath(value: string): string {
+  return sep === '/' ? value : value.split(sep).join('/');
+}
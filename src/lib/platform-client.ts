@@ -27,6 +27,8 @@ export interface ChangedFilesSnapshot {
   files: FileChange[];
   complete: boolean;
   incompleteFiles: string[];
+  /** Head commit SHA the snapshot was computed against, when the platform reports it */
+  headSha?: string;
 }
 
 /**
@@ -49,6 +51,8 @@ export interface PullRequest {
   targetBranch: string;
   /** Head commit SHA */
   headSha: string;
+  /** Base commit SHA the diff is computed against, when the platform reports it */
+  baseSha?: string;
   /** Additional platform-specific data */
   platformData?: unknown;
 }
@@ -97,42 +97,10 @@ export class ReviewAgentExecutionError extends Error {
 }
 
 /**
- * Build base review instructions for agents
- *
- * @param label - Human-readable label for the review (e.g., "PR/MR #123", "Local staged diff")
- * @param files - List of files with optional diff content
- * @param diffCommand - Fallback git diff command hint (used when diff not provided)
+ * Static parts of the review prompt, hoisted so every review sends an identical prefix
+ * and only the file-specific sections vary between runs
  */
-export function buildBaseInstructions(
-  label: string,
-  files: FileWithDiff[],
-  diffCommand?: string,
-  compressionSummary?: string,
-  verificationContext?: ReviewVerificationContext
-): string {
-  // Check if we have actual diff content
-  const filesWithDiffs = files.filter((f) => f.patch);
-  const hasDiffs = filesWithDiffs.length > 0;
-
-  const fileList = files.map((f) => `- ${f.filename}`).join('\n');
-
-  if (hasDiffs) {
-    // We have diff content from the platform - include it directly
-    const diffContent = filesWithDiffs
-      .map((f) => `### ${f.filename}\n\`\`\`diff\n${f.patch}\n\`\`\``)
-      .join('\n\n');
-
-    return `Review the following changed files from ${label}:
-
-${fileList}
-
-## Diff Content
-
-The following shows exactly what changed in this PR/MR:
-
-${diffContent}
-
-${compressionSummary ? `${compressionSummary}\n\n` : ''}Output requirements:
+const REVIEW_OUTPUT_REQUIREMENTS_HEAD = `Output requirements:
 - Return only the raw JSON object.
 - Do not call write_json_output.
 - Do not include markdown, code fences, or extra text.
@@ -141,7 +109,9 @@ ${compressionSummary ? `${compressionSummary}\n\n` : ''}Output requirements:
 {
   "timestamp": "ISO-8601 timestamp or descriptive string",
   "summary": {
-    "filesReviewed": ${files.length},
+    "filesReviewed": `;
+
+const REVIEW_OUTPUT_REQUIREMENTS_TAIL = `,
     "issuesFound": 0,
     "bySeverity": {
       "CRITICAL": 0,
@@ -169,10 +139,21 @@ ${compressionSummary ? `${compressionSummary}\n\n` : ''}Output requirements:
       "references": ["https://link1", "https://link2"],
       "agent": "security" | "quality" | "style" | "performance" | "documentation" | "unified"
     }
-  ]${verificationContext ? buildVerificationSchemaSnippet() : ''}
-}
+  ]`;
+
+const VERIFICATION_SCHEMA_SNIPPET = `,
+  "verification": {
+    "findings": [
+      {
+        "id": "F001",
+        "disposition": "resolved",
+        "rationale": "short explanation",
+        "issue": null
+      }
+    ]
+  }`;
 
-**Analysis approach:**
+const REVIEW_WITH_DIFFS_INSTRUCTIONS = `**Analysis approach:**
 1. First, use Grep or Read to quickly understand the project's existing patterns relevant to the changed files (e.g., existing validation, error handling, auth patterns, naming conventions).
 2. Then analyze the diff content above against those established patterns.
 3. If the prompt says a diff was omitted or summarized, call git_diff for that file before making file-specific claims.
@@ -182,74 +163,81 @@ ${compressionSummary ? `${compressionSummary}\n\n` : ''}Output requirements:
 5. For an issue caused by an added or modified line, set "line" to that added new-file line. For an issue caused solely by deleted code, omit "line" unless a relevant added line independently anchors the issue. Never use an old-file line number from a deleted line.
 6. Only report a deletion when removing the code creates a concrete behavioral regression, such as lost validation, authorization, cleanup, compatibility, or test coverage.
 7. Populate summary counts based on the issues you report (use 0 when none).`;
-  }
-
-  // No diff content available - instruct agent to read files directly
-  return `Review the following changed files from ${label}:
-
-${fileList}
-
-${compressionSummary ? `${compressionSummary}\n\n` : ''}Output requirements:
-- Return only the raw JSON object.
-- Do not call write_json_output.
-- Do not include markdown, code fences, or extra text.
-- The "line" property is optional. Include it only for a valid added new-file line; omit it for a deletion-only finding without a genuine added-line anchor.
-- Follow this exact schema:
-{
-  "timestamp": "ISO-8601 timestamp or descriptive string",
-  "summary": {
-    "filesReviewed": ${files.length},
-    "issuesFound": 0,
-    "bySeverity": {
-      "CRITICAL": 0,
-      "HIGH": 0,
-      "MEDIUM": 0,
-      "LOW": 0
-    },
-    "byCategory": {
-      "SECURITY": 0,
-      "QUALITY": 0,
-      "STYLE": 0,
-      "PERFORMANCE": 0,
-      "DOCUMENTATION": 0
-    }
-  },
-  "issues": [
-    {
-      "category": "SECURITY" | "QUALITY" | "STYLE" | "PERFORMANCE" | "DOCUMENTATION",
-      "severity": "CRITICAL" | "HIGH" | "MEDIUM" | "LOW",
-      "title": "Brief title",
-      "file": "path/to/file.ts",
-      "line": 42,
-      "problem": "Description of the problem",
-      "solution": "How to fix it",
-      "references": ["https://link1", "https://link2"],
-      "agent": "security" | "quality" | "style" | "performance" | "documentation" | "unified"
-    }
-  ]${verificationContext ? buildVerificationSchemaSnippet() : ''}
-}
 
-**Instructions:**
+const REVIEW_WITHOUT_DIFFS_INSTRUCTIONS = `**Instructions:**
 1. The diffs for these files were omitted due to size constraints. Use git_diff to inspect the file diffs, then use Read/Grep for surrounding context as needed.
 2. Report only concrete issues introduced by additions, modifications, or deletions in the git_diff output. Do not report unchanged pre-existing code.
 3. For an issue caused by an added or modified line, set "line" to that added new-file line. For an issue caused solely by deleted code, omit "line" unless a relevant added line independently anchors the issue. Never use an old-file line number from a deleted line.
 4. Only report a deletion when removing the code creates a concrete behavioral regression, such as lost validation, authorization, cleanup, compatibility, or test coverage.
 5. Analyze the changed code for issues in your specialty area.
 6. Populate summary counts based on the issues you report (use 0 when none).`;
+
+function formatReviewOutputRequirements(
+  filesReviewed: number,
+  includeVerification: boolean
+): string {
+  return [
+    REVIEW_OUTPUT_REQUIREMENTS_HEAD,
+    filesReviewed,
+    REVIEW_OUTPUT_REQUIREMENTS_TAIL,
+    includeVerification ? VERIFICATION_SCHEMA_SNIPPET : '',
+    '\n}',
+  ].join('');
 }
 
-function buildVerificationSchemaSnippet(): string {
-  return `,
-  "verification": {
-    "findings": [
-      {
-        "id": "F001",
-        "disposition": "resolved",
-        "rationale": "short explanation",
-        "issue": null
-      }
-    ]
-  }`;
+/**
+ * Build base review instructions for agents
+ *
+ * @param label - Human-readable label for the review (e.g., "PR/MR #123", "Local staged diff")
+ * @param files - List of files with optional diff content
+ * @param diffCommand - Fallback git diff command hint (used when diff not provided)
+ */
+export function buildBaseInstructions(
+  label: string,
+  files: FileWithDiff[],
+  diffCommand?: string,
+  compressionSummary?: string,
+  verificationContext?: ReviewVerificationContext
+): string {
+  // Check if we have actual diff content
+  const filesWithDiffs = files.filter((f) => f.patch);
+  const hasDiffs = filesWithDiffs.length > 0;
+
+  const fileList = files.map((f) => `- ${f.filename}`).join('\n');
+  const outputRequirements = formatReviewOutputRequirements(
+    files.length,
+    verificationContext !== undefined
+  );
+
+  if (hasDiffs) {
+    // We have diff content from the platform - include it directly
+    const diffContent = filesWithDiffs
+      .map((f) => `### ${f.filename}\n\`\`\`diff\n${f.patch}\n\`\`\``)
+      .join('\n\n');
+
+    return `Review the following changed files from ${label}:
+
+${fileList}
+
+## Diff Content
+
+The following shows exactly what changed in this PR/MR:
+
+${diffContent}
+
+${compressionSummary ? `${compressionSummary}\n\n` : ''}${outputRequirements}
+
+${REVIEW_WITH_DIFFS_INSTRUCTIONS}`;
+  }
+
+  // No diff content available - instruct agent to read files directly
+  return `Review the following changed files from ${label}:
+
+${fileList}
+
+${compressionSummary ? `${compressionSummary}\n\n` : ''}${outputRequirements}
+
+${REVIEW_WITHOUT_DIFFS_INSTRUCTIONS}`;
 }
 
 /**
@@ -396,7 +384,7 @@ async function executeSingleAgent(
   const configuredSkills = getConfiguredSkillsForAgent(config, agentType);
   const modelId = reviewModelOverrides[agentName];
   let sawSkillToolCall = false;
-  let fullResponse = '';
+  const responseParts: string[] = [];
 
   try {
     // Build prompt with global and agent-specific context
@@ -473,7 +461,7 @@ async function executeSingleAgent(
         if (!message.content.trim()) {
           continue;
         }
-        fullResponse += message.content;
+        responseParts.push(message.content);
         if (debug) {
           console.log(chalk.gray(`┌── DEBUG: Full response from ${agentName}`));
           console.log(message.content);
@@ -490,7 +478,7 @@ async function executeSingleAgent(
 
     await runtime.closeSession(session.id);
 
-    const reviewOutput = await parseReviewOutput(workingDir, debug, fullResponse);
+    const reviewOutput = await parseReviewOutput(workingDir, debug, responseParts.join(''));
     const parsed = parseReviewIssuesWithDiagnostics(JSON.stringify(reviewOutput), agentType);
     const parsedIssues = parsed.issues;
     const verification = parseReviewVerification(reviewOutput);
@@ -524,7 +512,8 @@ async function executeSingleAgent(
       parserDiagnostics:
         error instanceof Error && 'code' in error && error.code === 'REVIEW_OUTPUT_PARSE_ERROR'
           ? {
-              rawResponsePresent: fullResponse.trim().length > 0,
+              // Whitespace-only assistant messages are never collected.
+              rawResponsePresent: responseParts.length > 0,
               validJson: false,
               validReviewSchema: false,
               emittedCount: 0,
@@ -14,7 +14,7 @@ import {
 import { dirname, isAbsolute, relative, resolve, sep } from 'path';
 import { promisify } from 'util';
 import { loadOkfProvenanceMap } from './okf-wiki.js';
-import { resolveWithinWorkingDir } from './path-utils.js';
+import { resolveWithinWorkingDir, toPosixPath } from './path-utils.js';
 
 const execFileAsync = promisify(execFile);
 const WIKI_STATE_VERSION = 1 as const;
@@ -754,10 +754,6 @@ function isPathWithin(filePath: string, directoryPath: string): boolean {
   return filePath === directoryPath || filePath.startsWith(`${directoryPath}/`);
 }
 
-function toPosixPath(value: string): string {
-  return sep === '/' ? value : value.split(sep).join('/');
-}
-
 function compareStrings(left: string, right: string): number {
   return left < right ? -1 : left > right ? 1 : 0;
 }
@@ -276,7 +276,7 @@ export const ACTION_OPTION_FIELDS: Partial<
   review: new Set(['source', 'reviewArtifact', 'severity', 'artifact']),
   'review-context': new Set(['source', 'file', 'baseBranch']),
   describe: new Set(['source', 'post', 'postDescription']),
-  'code-quality-report': new Set(['review', 'path']),
+  'code-quality-report': new Set(['review', 'path', 'pretty']),
   'plan-wiki-update': new Set(['root', 'statePath', 'instructions', 'instructionsPath']),
   'sync-okf-indexes': new Set(['root', 'version']),
   'validate-okf-wiki': new Set(['root', 'version']),
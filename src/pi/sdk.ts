@@ -32,7 +32,7 @@ import { writeJsonOutput } from '../lib/write-json-output.js';
 import { extractHtmlDocument, writeArtifactOutput } from '../lib/html-artifact.js';
 import type { FixCheckConfig } from '../lib/config.js';
 import { isReviewArtifactPayload } from '../lib/review-artifact.js';
-import { resolveWithinWorkingDir } from '../lib/path-utils.js';
+import { resolveWithinWorkingDir, toPosixPath } from '../lib/path-utils.js';
 import type { TraceCollector } from '../lib/trace-collector.js';
 import {
   AgentFilesystemAuthorizer,
@@ -157,10 +157,6 @@ function parseAgentValidation(value: unknown): AgentValidation | undefined {
   return value as AgentValidation;
 }
 
-function toPosixPath(value: string): string {
-  return sep === '/' ? value : value.split(sep).join('/');
-}
-
 function resolvePiToolPath(workingDir: string, requestedPath: string): string {
   let normalized = requestedPath.replace(/[\u00A0\u2000-\u200A\u202F\u205F\u3000]/gu, ' ');
   if (normalized.startsWith('@')) normalized = normalized.slice(1);
@@ -431,18 +427,33 @@ function normalizeGitDiffMaxBytes(maxBytes: number | undefined): number {
   return Math.max(1, Math.min(Math.floor(maxBytes), HARD_GIT_DIFF_MAX_BYTES));
 }
 
-function appendCappedChunk(chunks: Buffer[], chunk: Buffer, maxBytes: number): boolean {
-  const currentBytes = chunks.reduce((sum, existing) => sum + existing.length, 0);
-  const remaining = maxBytes - currentBytes;
+interface CappedChunks {
+  chunks: Buffer[];
+  bytes: number;
+}
+
+function createCappedChunks(): CappedChunks {
+  return { chunks: [], bytes: 0 };
+}
+
+function appendCappedChunk(target: CappedChunks, chunk: Buffer, maxBytes: number): boolean {
+  const remaining = maxBytes - target.bytes;
   if (remaining <= 0) {
     return chunk.length > 0;
   }
-  if (chunk.length <= remaining) {
-    chunks.push(chunk);
-    return false;
-  }
-  chunks.push(chunk.subarray(0, remaining));
-  return true;
+  const kept = chunk.length <= remaining ? chunk : chunk.subarray(0, remaining);
+  target.chunks.push(kept);
+  target.bytes += kept.length;
+  return kept.length < chunk.length;
+}
+
+function cappedChunksToString(target: CappedChunks): string {
+  return Buffer.concat(target.chunks, target.bytes).toString('utf8');
+}
+
+/** Read-only git calls skip optional index locks so they never contend with the agent's writes. */
+function readOnlyGitEnv(): NodeJS.ProcessEnv {
+  return { ...process.env, GIT_OPTIONAL_LOCKS: '0' };
 }
 
 function runGitDiff(
@@ -453,11 +464,12 @@ function runGitDiff(
   return new Promise((resolvePromise, reject) => {
     const child = spawn('git', ['diff', '--no-ext-diff', '-M', ...args], {
       cwd: workingDir,
+      env: readOnlyGitEnv(),
       stdio: ['ignore', 'pipe', 'pipe'],
     });
 
-    const stdoutChunks: Buffer[] = [];
-    const stderrChunks: Buffer[] = [];
+    const stdoutChunks = createCappedChunks();
+    const stderrChunks = createCappedChunks();
     let truncated = false;
 
     child.stdout.on('data', (chunk: Buffer) => {
@@ -470,14 +482,14 @@ function runGitDiff(
 
     child.on('error', reject);
     child.on('close', (code) => {
-      const stderr = Buffer.concat(stderrChunks).toString('utf8').trim();
+      const stderr = cappedChunksToString(stderrChunks).trim();
       if (code !== 0) {
         reject(new Error(stderr || `git diff exited with code ${code ?? 'unknown'}`));
         return;
       }
 
       resolvePromise({
-        stdout: Buffer.concat(stdoutChunks).toString('utf8'),
+        stdout: cappedChunksToString(stdoutChunks),
         truncated,
       });
     });
@@ -488,11 +500,12 @@ function runGitNameStatus(workingDir: string, args: string[]): Promise<string> {
   return new Promise((resolvePromise, reject) => {
     const child = spawn('git', ['diff', '--name-status', '-M', ...args], {
       cwd: workingDir,
+      env: readOnlyGitEnv(),
       stdio: ['ignore', 'pipe', 'pipe'],
     });
 
     const stdoutChunks: Buffer[] = [];
-    const stderrChunks: Buffer[] = [];
+    const stderrChunks = createCappedChunks();
 
     child.stdout.on('data', (chunk: Buffer) => {
       stdoutChunks.push(chunk);
@@ -504,7 +517,7 @@ function runGitNameStatus(workingDir: string, args: string[]): Promise<string> {
 
     child.on('error', reject);
     child.on('close', (code) => {
-      const stderr = Buffer.concat(stderrChunks).toString('utf8').trim();
+      const stderr = cappedChunksToString(stderrChunks).trim();
       if (code !== 0) {
         reject(new Error(stderr || `git diff --name-status exited with code ${code ?? 'unknown'}`));
         return;
@@ -659,6 +672,7 @@ async function getChangedFiles(workingDir: string): Promise<string[]> {
   return new Promise((resolvePromise) => {
     const child = spawn('git', ['status', '--porcelain', '--no-renames'], {
       cwd: workingDir,
+      env: readOnlyGitEnv(),
       stdio: ['ignore', 'pipe', 'pipe'],
     });
 
@@ -699,8 +713,8 @@ function runCheckCommand(workingDir: string, check: FixCheckConfig): Promise<Che
       stdio: ['ignore', 'pipe', 'pipe'],
     });
 
-    const stdoutChunks: Buffer[] = [];
-    const stderrChunks: Buffer[] = [];
+    const stdoutChunks = createCappedChunks();
+    const stderrChunks = createCappedChunks();
     let truncated = false;
     let timedOut = false;
     const startTime = Date.now();
@@ -737,10 +751,10 @@ function runCheckCommand(workingDir: string, check: FixCheckConfig): Promise<Che
         name: check.name,
         command: check.command,
         exitCode: timedOut ? null : code,
-        stdout: Buffer.concat(stdoutChunks).toString('utf8'),
+        stdout: cappedChunksToString(stdoutChunks),
         stderr:
           (timedOut ? `Timed out after ${timeoutMs}ms\n` : '') +
-          Buffer.concat(stderrChunks).toString('utf8'),
+          cappedChunksToString(stderrChunks),
         truncated,
         skipped: false,
         durationMs: Date.now() - startTime,
@@ -1475,6 +1489,12 @@ class PiSessionRuntime {
           const maxBytes = normalizeGitDiffMaxBytes(params.maxBytes);
           const range = base && head ? [`${base}...${head}`] : base ? [base] : [];
 
+          // Start name-status alongside the diff so both git processes overlap.
+          const nameStatusPromise =
+            range.length > 0
+              ? runGitNameStatus(workingDir, range).catch(() => undefined)
+              : Promise.resolve(undefined);
+
           let diff = '';
           let truncated = false;
           let error: string | undefined;
@@ -1487,13 +1507,10 @@ class PiSessionRuntime {
           }
 
           let metadata = extractGitDiffMetadata(diff);
-          if (error === undefined && range.length > 0) {
-            try {
-              const nameStatus = await runGitNameStatus(workingDir, range);
-              metadata = mergeGitNameStatusMetadata(metadata, nameStatus, file);
-            } catch {
-              // Diff text remains authoritative; name-status only enriches metadata.
-            }
+          // Diff text remains authoritative; name-status only enriches metadata.
+          const nameStatus = await nameStatusPromise;
+          if (error === undefined && nameStatus !== undefined) {
+            metadata = mergeGitNameStatusMetadata(metadata, nameStatus, file);
           }
 
           const details = {
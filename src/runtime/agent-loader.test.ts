@@ -122,6 +122,29 @@ describe('agent-loader path resolution', () => {
     expect(unifiedAgent?.path).toMatch(/\.pi[\\/]agents[\\/]review[\\/]unified-reviewer\.md$/);
   });
 
+  it('does not leak changes to loaded built-in agents into later loads', () => {
+    const first = loadAgents(process.cwd());
+    const reviewer = first.find((agent) => agent.id === 'review/unified-reviewer');
+    if (!reviewer?.tools) {
+      throw new Error('Expected the packaged unified reviewer to declare tools');
+    }
+    const originalPrompt = reviewer.prompt;
+    const originalTools = { ...reviewer.tools };
+
+    reviewer.prompt = 'mutated prompt';
+    reviewer.tools.Bash = true;
+    reviewer.tools.Mutated = true;
+    (reviewer.skills ??= []).push('mutated-skill');
+
+    const second = loadAgents(process.cwd());
+    const reloaded = second.find((agent) => agent.id === 'review/unified-reviewer');
+
+    expect(reloaded).not.toBe(reviewer);
+    expect(reloaded?.prompt).toBe(originalPrompt);
+    expect(reloaded?.tools).toEqual(originalTools);
+    expect(reloaded?.skills ?? []).not.toContain('mutated-skill');
+  });
+
   it('loads packaged visual explainer agent', () => {
     const agents = loadAgents(process.cwd());
     const visualAgent = agents.find((agent) => agent.id === 'visual/pr-explainer');
@@ -23,6 +23,8 @@ export interface AgentDefinition {
 
 class InvalidProjectAgentPathError extends Error {}
 
+let cachedBuiltInAgents: AgentDefinition[] | undefined;
+
 /** Parse a frontmatter value into a trimmed, non-empty string array. */
 function asStringArray(value: unknown): string[] | undefined {
   if (!Array.isArray(value)) {
@@ -57,19 +59,32 @@ export function loadAgents(projectPath: string, config?: DRSConfig): AgentDefini
     }
   }
 
-  for (const builtInPath of getBuiltInAgentPaths()) {
-    const builtInAgents = discoverAgents(builtInPath, builtInPath);
-    for (const agent of builtInAgents) {
-      if (!discovered.has(agent.id)) {
-        agents.push(agent);
-        discovered.add(agent.id);
-      }
+  for (const agent of loadBuiltInAgents()) {
+    if (!discovered.has(agent.id)) {
+      // Copy so callers can adjust an agent without touching the cached definition.
+      agents.push({
+        ...agent,
+        tools: agent.tools && { ...agent.tools },
+        skills: agent.skills && [...agent.skills],
+      });
+      discovered.add(agent.id);
     }
   }
 
   return agents;
 }
 
+/**
+ * Built-in agents ship with the package and do not change while the process
+ * runs, so they are discovered and parsed once.
+ */
+function loadBuiltInAgents(): AgentDefinition[] {
+  cachedBuiltInAgents ??= getBuiltInAgentPaths().flatMap((builtInPath) =>
+    discoverAgents(builtInPath, builtInPath)
+  );
+  return cachedBuiltInAgents;
+}
+
 function traverseDirectory(
   basePath: string,
   currentPath: string,
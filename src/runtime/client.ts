@@ -16,7 +16,7 @@ import {
 import { getLogger } from '../lib/logger.js';
 import { loadAgents, type AgentDefinition } from './agent-loader.js';
 import { resolveAgentPaths } from './path-config.js';
-import { createPiInProcessServer, type PiClient } from '../pi/sdk.js';
+import { createPiInProcessServer, type PiClient, type PiSessionMessage } from '../pi/sdk.js';
 import type { TraceCollector } from '../lib/trace-collector.js';
 import type { AgentPermissions, AgentValidation } from '../lib/agent-permissions.js';
 
@@ -112,6 +112,15 @@ function mapPiRuntimeError(operation: string, error: unknown): Error {
   return new Error(`Failed to ${operation}: ${message}`);
 }
 
+function findLastAssistantMessage(messages: PiSessionMessage[]): PiSessionMessage | undefined {
+  for (let i = messages.length - 1; i >= 0; i--) {
+    if (messages[i].info?.role === 'assistant') {
+      return messages[i];
+    }
+  }
+  return undefined;
+}
+
 function buildAgentSkillConfiguration(
   config: DRSConfig,
   agents: AgentDefinition[]
@@ -605,7 +614,7 @@ export class RuntimeClient {
         lastMessageCount = messages.length;
 
         // Check if the last assistant message has completed
-        const lastAssistantMsg = [...messages].reverse().find((m) => m.info?.role === 'assistant');
+        const lastAssistantMsg = findLastAssistantMessage(messages);
 
         if (lastAssistantMsg) {
           const isComplete = lastAssistantMsg.info?.time?.completed !== undefined;